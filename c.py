@@ -18,186 +18,523 @@ import ast
 import sys
 import os
 import marshal
+import mmap
+import operator
+import struct
+import time
 import types
 import importlib.util
-from typing import Dict, Optional, Tuple
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+try:
+    import xxhash
+except ImportError:
+    # Embedded builds ship without third-party packages
+    xxhash = None
+    import hashlib
+
+def source_digest(source: str) -> int:
+    # 64-bit content digest of the source text (xxh3 when available)
+    if xxhash is not None:
+        return xxhash.xxh3_64_intdigest(source.encode('utf-8'))
+    return int.from_bytes(hashlib.blake2b(source.encode('utf-8'), digest_size=8).digest(), 'little')
+
+def read_source(path: str, chunk_size: int = 128 * 1024) -> Tuple[str, int]:
+    # Read a source file and compute its digest in the same pass
+    hasher = xxhash.xxh3_64() if xxhash is not None else hashlib.blake2b(digest_size=8)
+    buf = bytearray()
+    with open(path, 'rb') as f:
+        while chunk := f.read(chunk_size):
+            hasher.update(chunk)
+            buf += chunk
+    if xxhash is not None:
+        digest = hasher.intdigest()
+    else:
+        digest = int.from_bytes(hasher.digest(), 'little')
+    # Honour PEP 263 coding declarations and a UTF-8 BOM, like the import system
+    return importlib.util.decode_source(bytes(buf)), digest
+
+def iter_sources(root: str,
+                 on_error: Optional[Callable[[str, OSError], None]] = None) -> Iterator[str]:
+    # Yield every .py file below root, skipping __pycache__ directories
+    # A directory that can't be listed goes to on_error (like os.walk's onerror)
+    # and is skipped; without a handler the OSError propagates
+    stack = [root]
+    while stack:
+        path = stack.pop()
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError as e:
+            if on_error is None:
+                raise
+            on_error(path, e)
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name != '__pycache__':
+                    stack.append(entry.path)
+            elif entry.name.endswith('.py') and entry.is_file():
+                yield entry.path
+
+# Constant folding tables, keyed by AST operator type
+_FOLD_OPS = {
+    ast.Add: operator.add, ast.Sub: operator.sub,
+    ast.Mult: operator.mul, ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv, ast.Mod: operator.mod,
+    ast.Pow: operator.pow, ast.LShift: operator.lshift,
+    ast.RShift: operator.rshift, ast.BitOr: operator.or_,
+    ast.BitAnd: operator.and_, ast.BitXor: operator.xor
+}
+_UNARY_OPS = {
+    ast.USub: operator.neg, ast.UAdd: operator.pos,
+    ast.Not: operator.not_, ast.Invert: operator.invert
+}
+_CMP_OPS = {
+    ast.Eq: operator.eq, ast.NotEq: operator.ne,
+    ast.Lt: operator.lt, ast.LtE: operator.le,
+    ast.Gt: operator.gt, ast.GtE: operator.ge
+}
+
+# Operand and operator classes for the fold guards
+_NUMBER = (int, float, complex)
+_BITWISE_OPS = {operator.or_, operator.and_, operator.xor}
+_INT_OPS = _BITWISE_OPS | {operator.pow, operator.lshift, operator.rshift}
+_DIVISION_OPS = {operator.truediv, operator.floordiv, operator.mod}
+_ORDER_OPS = {operator.lt, operator.le, operator.gt, operator.ge}
+# Largest folded int result, in bits (MAX_INT_SIZE in CPython's ast_opt.c)
+_MAX_INT_BITS = 128
+
+# Python 3.13+ can return the AST after CPython's own optimizer has run
+_AST_FLAGS = getattr(ast, 'PyCF_OPTIMIZED_AST', ast.PyCF_ONLY_AST)
+
+def _constant(value, node: ast.AST) -> ast.Constant:
+    # Folded nodes keep the source location for compile()
+    return ast.copy_location(ast.Constant(value), node)
+
+def _fits_float(value) -> bool:
+    # ints past float range raise OverflowError when mixed with floats
+    return not isinstance(value, int) or value.bit_length() <= 1023
+
+def _can_fold_binop(op, left, right) -> bool:
+    # Explicit checks instead of try/except: fold only what cannot raise
+    if not isinstance(left, _NUMBER) or not isinstance(right, _NUMBER):
+        return False
+    if op in _INT_OPS:
+        if not isinstance(left, int) or not isinstance(right, int):
+            return False
+        if op in _BITWISE_OPS:
+            return True
+        if right < 0:
+            return False
+        # Bound the result like CPython's ast_opt.c, so nested folds such as
+        # ((9 ** 128) ** 128) ** 128 never build huge constants
+        if op is operator.pow:
+            return left.bit_length() * right <= _MAX_INT_BITS
+        if op is operator.lshift:
+            return left.bit_length() + right <= _MAX_INT_BITS
+        return True
+    if op in _DIVISION_OPS:
+        if right == 0:
+            return False
+        if op is not operator.truediv and (isinstance(left, complex) or isinstance(right, complex)):
+            return False
+    if op is operator.truediv or not isinstance(left, int) or not isinstance(right, int):
+        return _fits_float(left) and _fits_float(right)
+    if op is operator.mul and left and right:
+        return left.bit_length() + right.bit_length() <= _MAX_INT_BITS
+    return True
+
+def _fold_binop(node: ast.BinOp) -> ast.AST:
+    op = _FOLD_OPS.get(type(node.op))
+    if op and type(node.left) is ast.Constant and type(node.right) is ast.Constant:
+        left, right = node.left.value, node.right.value
+        if _can_fold_binop(op, left, right):
+            return _constant(op(left, right), node)
+    return node
+
+def _fold_unaryop(node: ast.UnaryOp) -> ast.AST:
+    op = _UNARY_OPS.get(type(node.op))
+    if op and type(node.operand) is ast.Constant:
+        value = node.operand.value
+        # not works on any constant, +/- on numbers, ~ on ints (not bools: deprecated)
+        if op is operator.not_:
+            foldable = True
+        elif op is operator.invert:
+            foldable = type(value) is int
+        else:
+            foldable = isinstance(value, _NUMBER)
+        if foldable:
+            return _constant(op(value), node)
+    return node
+
+def _fold_boolop(node: ast.BoolOp) -> ast.AST:
+    if all(type(v) is ast.Constant for v in node.values):
+        # Same short-circuit result as the interpreter: the first
+        # falsy (and) / truthy (or) operand, else the last one
+        is_and = type(node.op) is ast.And
+        for v in node.values:
+            if bool(v.value) != is_and:
+                break
+        return _constant(v.value, node)
+    return node
+
+def _can_compare(op, left, right) -> bool:
+    # Numbers compare with numbers (complex only for ==/!=), str/bytes with their own type
+    if isinstance(left, _NUMBER) and isinstance(right, _NUMBER):
+        return op not in _ORDER_OPS or not (isinstance(left, complex) or isinstance(right, complex))
+    return type(left) is type(right) and isinstance(left, (str, bytes))
+
+def _fold_compare(node: ast.Compare) -> ast.AST:
+    operands = [node.left, *node.comparators]
+    ops = [_CMP_OPS.get(type(op)) for op in node.ops]
+    if all(ops) and all(type(v) is ast.Constant for v in operands):
+        pairs = list(zip(ops, operands, operands[1:]))
+        if all(_can_compare(op, a.value, b.value) for op, a, b in pairs):
+            return _constant(all(op(a.value, b.value) for op, a, b in pairs), node)
+    return node
+
+_FOLDERS = {
+    ast.BinOp: _fold_binop, ast.UnaryOp: _fold_unaryop,
+    ast.BoolOp: _fold_boolop, ast.Compare: _fold_compare
+}
+
+def _optimize_ast(tree: ast.AST) -> ast.AST:
+    # Fold constant expressions in place. Reversed breadth-first order
+    # visits children before their parents, so folds cascade upwards.
+    # Hot loop: lookups are bound to locals and fields read directly
+    # instead of through the ast.iter_fields generator.
+    get_folder = _FOLDERS.get
+    for node in reversed(list(ast.walk(tree))):
+        for field in node._fields:
+            value = getattr(node, field, None)
+            if type(value) is list:
+                for i, item in enumerate(value):
+                    fold = get_folder(type(item))
+                    if fold is not None:
+                        value[i] = fold(item)
+            else:
+                fold = get_folder(type(value))
+                if fold is not None:
+                    setattr(node, field, fold(value))
+    return tree
 
 class PythonCompiler:
     # Core compiler implementation with PYC support
     
-    # Magic number for Python 3.13 (example)
+    # Magic number of the running interpreter
     PYTHON_MAGIC = importlib.util.MAGIC_NUMBER
     
+    # Implementation/version tag used in .pyc names
+    _PYTHON_TAG = f"mini-{sys.version_info[0]}{sys.version_info[1]:02d}"
+    
+    # .pyc header: magic, source mtime, source size, source digest (low 32 bits)
+    _PYC_HEADER = struct.Struct('<4sIII')
+    
+    # compile() optimization level; CPython's own AST optimizer does the folding
+    OPTIMIZE_LEVEL = 2
+    
     def __init__(self):
         self.optimizations = {
-            'constant_folding': True,
-            'peephole': True
+            # Python-level folding pass, for teaching (off: the C optimizer covers it)
+            'constant_folding': False
         }
         self._code_cache: Dict[Tuple[str, int], types.CodeType] = {}
+        # Most recent (source, filename, code) only; holding one source bounds memory
+        self._last_source: Optional[Tuple[str, str, types.CodeType]] = None
+        # path -> (mtime_ns, size, code), checked before reading and hashing
+        self._mtime_cache: Dict[str, Tuple[int, int, types.CodeType]] = {}
 
-    def compile_source(self, source: str, filename: str = "<string>") -> types.CodeType:
+    def compile_source(self, source: str, filename: str = "<string>",
+                       digest: Optional[int] = None) -> types.CodeType:
         # Compile Python source to bytecode
-        cache_key = (filename, hash(source))
+        # digest may be precomputed by read_source to skip hashing here
+        # Same string object again: O(1) hit without hashing the text
+        entry = self._last_source
+        if entry is not None and entry[0] is source and entry[1] == filename:
+            return entry[2]
+        
+        if digest is None:
+            try:
+                digest = source_digest(source)
+            except Exception as e:
+                # e.g. lone surrogates; report like any other bad source
+                raise CompilerError(f"Compilation failed: {str(e)}")
+        cache_key = (filename, digest)
         if cache_key in self._code_cache:
-            return self._code_cache[cache_key]
+            code = self._code_cache[cache_key]
+            self._last_source = (source, filename, code)
+            return code
         
         try:
-            tree = ast.parse(source, filename, 'exec')
-            
             if self.optimizations['constant_folding']:
-                tree = self._optimize_ast(tree)
-            
-            code = compile(tree, filename, 'exec')
-            
-            if self.optimizations['peephole']:
-                code = self._peephole_optimize(code)
-            
-            self._code_cache[cache_key] = code
-            return code
-            
+                code = self._compile_folded(source, filename)
+            else:
+                # CPython's C optimizer folds constants, comparisons and dead branches
+                code = compile(source, filename, 'exec', dont_inherit=True,
+                               optimize=self.OPTIMIZE_LEVEL)
         except Exception as e:
             raise CompilerError(f"Compilation failed: {str(e)}")
+        
+        self._code_cache[cache_key] = code
+        self._last_source = (source, filename, code)
+        return code
+
+    def _compile_folded(self, source: str, filename: str) -> types.CodeType:
+        # Pedagogical fallback: extra Python-level folding pass over the AST.
+        # Start from the C optimizer's output where available, so the
+        # Python pass only walks what it left unfolded
+        tree = compile(source, filename, 'exec', _AST_FLAGS, dont_inherit=True,
+                       optimize=self.OPTIMIZE_LEVEL)
+        return compile(_optimize_ast(tree), filename, 'exec', dont_inherit=True,
+                       optimize=self.OPTIMIZE_LEVEL)
 
-    def _optimize_ast(self, node: ast.AST) -> ast.AST:
-        # Apply AST-level optimizations
-        class Optimizer(ast.NodeTransformer):
-            def visit_BinOp(self, node: ast.BinOp) -> ast.AST:
-                if (isinstance(node.left, ast.Constant)) and isinstance(node.right, ast.Constant):
-                    try:
-                        if isinstance(node.op, ast.Add):
-                            return ast.Constant(node.left.value + node.right.value)
-                        elif isinstance(node.op, ast.Sub):
-                            return ast.Constant(node.left.value - node.right.value)
-                        elif isinstance(node.op, ast.Mult):
-                            return ast.Constant(node.left.value * node.right.value)
-                        elif isinstance(node.op, ast.Div):
-                            return ast.Constant(node.left.value / node.right.value)
-                    except:
-                        pass
-                return node
-        return Optimizer().visit(node)
-
-    def _peephole_optimize(self, code: types.CodeType) -> types.CodeType:
-        # Basic bytecode optimization
+    def compile_file(self, path: str) -> types.CodeType:
+        # Compile a source file, reusing its __pycache__ entry when the digest matches
+        # Cheap check first: an unchanged mtime and size skip the read and hash
+        st = os.stat(path)
+        entry = self._mtime_cache.get(path)
+        if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            return entry[2]
+        
+        # pyc header records the same mtime and size: skip reading the source
+        pyc_path = self._pyc_path(path)
+        try:
+            code = self.load_pyc(pyc_path, source_stat=st)
+            self._mtime_cache[path] = (st.st_mtime_ns, st.st_size, code)
+            return code
+        except CompilerError:
+            pass
+        
+        source, digest = read_source(path)
+        cache_key = (path, digest)
+        if cache_key in self._code_cache:
+            code = self._code_cache[cache_key]
+            self._mtime_cache[path] = (st.st_mtime_ns, st.st_size, code)
+            return code
+        
+        # Touched but unchanged sources still match by digest
+        try:
+            code = self.load_pyc(pyc_path, digest)
+        except CompilerError:
+            # Missing, stale or corrupt: rebuild and refresh the cached pyc
+            code = self.compile_source(source, path, digest)
+        
+        # Either way the header didn't match this stat; rewrite it so the next
+        # run can take the mtime fast path again
+        if not sys.dont_write_bytecode:
+            try:
+                self.generate_pyc(code, path, digest, st)
+            except OSError:
+                pass  # Read-only location, run without caching
+        
+        self._code_cache[cache_key] = code
+        self._mtime_cache[path] = (st.st_mtime_ns, st.st_size, code)
         return code
 
-    def load_pyc(self, pyc_path: str) -> types.CodeType:
+    def load_pyc(self, pyc_path: str, digest: Optional[int] = None,
+                 source_stat: Optional[os.stat_result] = None) -> types.CodeType:
         # Load compiled code from .pyc file
+        # If digest is given, the pyc must have been built from that source;
+        # if source_stat is given, its mtime and size must match the header
         try:
-            with open(pyc_path, 'rb') as f:
-                # Read and validate header
-                magic = f.read(4)
+            # Map the file and unmarshal straight from the mapping
+            fd = os.open(pyc_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+            try:
+                mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+            finally:
+                os.close(fd)
+            
+            with mm, memoryview(mm) as view:
+                # Validate header (magic, mtime, size, source digest)
+                magic, mtime, size, stored = self._PYC_HEADER.unpack_from(view)
                 if magic != self.PYTHON_MAGIC:
                     raise CompilerError("Invalid magic number in .pyc file")
-                
-                # Skip timestamp and size (8 bytes)
-                f.read(8)
+                if digest is not None and stored != digest & 0xFFFFFFFF:
+                    raise CompilerError("Source digest mismatch in .pyc file")
+                if source_stat is not None and (
+                        mtime == 0
+                        or mtime != int(source_stat.st_mtime) & 0xFFFFFFFF
+                        or size != source_stat.st_size & 0xFFFFFFFF):
+                    raise CompilerError("Stale .pyc file")
                 
                 # Load marshaled code
-                return marshal.load(f)
+                with view[self._PYC_HEADER.size:] as payload:
+                    return marshal.loads(payload)
         except Exception as e:
             raise CompilerError(f"Failed to load .pyc file: {str(e)}")
 
-    def generate_pyc(self, code: types.CodeType, source_path: str) -> str:
+    def generate_pyc(self, code: types.CodeType, source_path: str, digest: int = 0,
+                     source_stat: Optional[os.stat_result] = None) -> str:
 
         #Generate standard .pyc file
+        # source_stat should be taken before the source was read, so the header
+        # never pairs a newer mtime/size with older bytecode
         
-        cache_dir = os.path.join(os.path.dirname(source_path), "__pycache__")
-        os.makedirs(cache_dir, exist_ok=True)
+        # One stat() for both header fields
+        st = source_stat if source_stat is not None else os.stat(source_path)
+        source_mtime = int(st.st_mtime) & 0xFFFFFFFF
+        # Modified in the current second: another edit within that second could
+        # keep mtime and size, so record 0 and leave loads to the digest check
+        if int(st.st_mtime) >= int(time.time()):
+            source_mtime = 0
+        source_size = st.st_size & 0xFFFFFFFF
         
-        base_name = os.path.splitext(os.path.basename(source_path))[0]
-        pyc_name = f"{base_name}.{self._get_python_tag()}.pyc"
-        pyc_path = os.path.join(cache_dir, pyc_name)
+        pyc_path = self._pyc_path(source_path)
+        os.makedirs(os.path.dirname(pyc_path), exist_ok=True)
         
-        with open(pyc_path, 'wb') as f:
-            # Write header
-            f.write(self.PYTHON_MAGIC)
-            f.write(int(os.path.getmtime(source_path)).to_bytes(4, 'little'))
-            f.write(os.path.getsize(source_path).to_bytes(4, 'little'))
-            f.write(b'\x00' * 4)  # Padding
-            
-            # Write marshaled code
-            marshal.dump(code, f)
+        # Header and marshaled code go out in a single write()
+        header = self._PYC_HEADER.pack(self.PYTHON_MAGIC, source_mtime, source_size,
+                                       digest & 0xFFFFFFFF)
+        payload = marshal.dumps(code)
+        
+        # Write to a temporary name and rename, so readers never see a partial pyc
+        tmp_path = f"{pyc_path}.{os.getpid()}.tmp"
+        try:
+            # Raw fd write: no file object, one write() syscall in practice
+            flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+            fd = os.open(tmp_path, flags, 0o644)
+            try:
+                data = memoryview(header + payload)
+                while data:
+                    data = data[os.write(fd, data):]
+            finally:
+                os.close(fd)
+            os.replace(tmp_path, pyc_path)
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
         
         return pyc_path
 
-    def _get_python_tag(self) -> str:
-        # Get Python implementation/version tag
-        return f"mini-{sys.version_info[0]}{sys.version_info[1]:02d}"
+    def _pyc_path(self, source_path: str) -> str:
+        # __pycache__/<file name>.<tag>.pyc next to the source file; the full
+        # name (extension included) keeps foo.py, foo.txt and foo apart
+        source_dir, source_name = os.path.split(source_path)
+        return os.path.join(source_dir, "__pycache__", f"{source_name}.{self._PYTHON_TAG}.pyc")
 
     def execute(self, code: types.CodeType, globals: Optional[Dict] = None) -> None:
         # Execute compiled code
         if globals is None:
-            globals = {
-                '__name__': '__main__',
-                '__file__': '<string>',
-                '__builtins__': __builtins__,
-                'PythonCompiler': PythonCompiler,  # For self-compilation
-                'CompilerError': CompilerError
-            }
+            globals = self._GLOBALS_TEMPLATE.copy()
         exec(code, globals)
 
 class CompilerError(Exception):
     # Custom compilation error (todo)
     pass
 
-def main():
+# Default globals for execute(), built once and copied per call
+PythonCompiler._GLOBALS_TEMPLATE = {
+    '__name__': '__main__',
+    '__file__': '<string>',
+    '__builtins__': __builtins__,
+    'PythonCompiler': PythonCompiler,  # For self-compilation
+    'CompilerError': CompilerError
+}
 
-    mode = 'execute'
-    target = sys.argv[1]
-    
-    match target:
-        case '-c':
-            if len(sys.argv) < 3:
-                print("[Error] Missing input file")
-                sys.exit(1)
-            mode = 'compile'
-            target = sys.argv[2]
-        case '-r':
-            if len(sys.argv) < 3:
-                print("[Error] Missing .pyc file")
-                sys.exit(1)
-            mode = 'run_pyc'
-            target = sys.argv[2]
-        case '-h':
-            print("[info] Usage:")
-            print("     |Execute script: python c.py script.py [args...]")
-            print("     |Compile to PYC: python c.py -c script.py")
-            print("     |Run PYC file:   python c.py -r script.pyc")
-            sys.exit(1)
-
-        case '-v':
-            print("mini Python Compiler v0.1.1")
-            print("Copyright (c) 2025 Dinnerb0ne<tomma_2022@outlook.com>")
-            sys.exit(0)
+def _target_arg(missing: str) -> str:
+    # Path argument following a flag; exits if absent or not found
+    if len(sys.argv) < 3:
+        print(f"[Error] {missing}")
+        sys.exit(1)
+    target = sys.argv[2]
+    _check_exists(target)
+    return target
 
-    
+def _check_exists(target: str) -> None:
     if not os.path.exists(target):
         print(f"[Error] File '{target}' not found")
         sys.exit(1)
+
+def _handle_compile() -> None:
+    # Compile to .pyc
+    target = _target_arg("Missing input file")
+    compiler = PythonCompiler()
+    st = os.stat(target)  # Before the read, see generate_pyc
+    source, digest = read_source(target)
+    code = compiler.compile_source(source, target, digest)
+    pyc_path = compiler.generate_pyc(code, target, digest, st)
+    print(f"[info] Successfully compiled to {pyc_path}")
+
+def _handle_compile_dir() -> None:
+    # Compile every script below the directory in this one process
+    target = _target_arg("Missing input directory")
+    if not os.path.isdir(target):
+        print(f"[Error] '{target}' is not a directory")
+        sys.exit(1)
+    compiler = PythonCompiler()
+    compiled = failed = 0
     
+    def list_failed(path: str, e: OSError) -> None:
+        nonlocal failed
+        print(f"[Error] Can't list {path}: {e}", file=sys.stderr)
+        failed += 1
+    
+    for path in iter_sources(target, list_failed):
+        try:
+            st = os.stat(path)
+            source, digest = read_source(path)
+            code = compiler.compile_source(source, path, digest)
+            compiler.generate_pyc(code, path, digest, st)
+            compiled += 1
+        except (CompilerError, SyntaxError, UnicodeDecodeError, OSError) as e:
+            # One bad file (undecodable, bad coding cookie, unreadable) must not end the batch
+            print(f"[Error] Compiler: {path}: {e}", file=sys.stderr)
+            failed += 1
+    print(f"[info] Compiled {compiled} file(s), {failed} failed")
+    if failed:
+        sys.exit(1)
+
+def _handle_run_pyc() -> None:
+    # Run .pyc directly
+    target = _target_arg("Missing .pyc file")
+    compiler = PythonCompiler()
+    code = compiler.load_pyc(target)
+    sys.argv = sys.argv[2:]  # Remove -r and pyc path
+    compiler.execute(code)
+
+def _handle_help() -> None:
+    print("[info] Usage:")
+    print("     |Execute script: python c.py script.py [args...]")
+    print("     |Compile to PYC: python c.py -c script.py")
+    print("     |Compile a tree: python c.py -C directory")
+    print("     |Run PYC file:   python c.py -r script.pyc")
+    sys.exit(1)
+
+def _handle_version() -> None:
+    print("mini Python Compiler v0.1.1")
+    print("Copyright (c) 2025 Dinnerb0ne<tomma_2022@outlook.com>")
+    sys.exit(0)
+
+def _handle_execute(target: str) -> None:
+    # Normal execution
+    _check_exists(target)
     compiler = PythonCompiler()
+    code = compiler.compile_file(target)
+    sys.argv = sys.argv[1:]  # Remove script path
+    compiler.execute(code)
+
+_FLAG_HANDLERS = {
+    '-c': _handle_compile,
+    '-C': _handle_compile_dir,
+    '-r': _handle_run_pyc,
+    '-h': _handle_help,
+    '-v': _handle_version
+}
+
+def main():
+
+    target = sys.argv[1]
+    handler = _FLAG_HANDLERS.get(target)
     
     try:
-        if mode == 'compile':
-            # Compile to .pyc
-            with open(target, 'r', encoding='utf-8') as f:
-                code = compiler.compile_source(f.read(), target)
-            pyc_path = compiler.generate_pyc(code, target)
-            print(f"[info] Successfully compiled to {pyc_path}")
-        
-        elif mode == 'run_pyc':
-            # Run .pyc directly
-            code = compiler.load_pyc(target)
-            sys.argv = sys.argv[2:]  # Remove -r and pyc path
-            compiler.execute(code)
-        
+        if handler is not None:
+            handler()
         else:
-            # Normal execution
-            with open(target, 'r', encoding='utf-8') as f:
-                code = compiler.compile_source(f.read(), target)
-            sys.argv = sys.argv[1:]  # Remove script path
-            compiler.execute(code)
+            _handle_execute(target)
             
     except CompilerError as e:
         print(f"[Error] Compiler: {e}", file=sys.stderr)